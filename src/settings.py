@@ -18,5 +18,7 @@ __all__ = [
 env = {
     'EMAIL': os.getenv('EMAIL'),
     'PHONE': os.getenv('PHONE'),
-    'QUEUE_ARN': os.getenv('QUEUE_ARN')
+    'QUEUE_ARN': os.getenv('QUEUE_ARN'),
+    'AWS_REGION': os.getenv('AWS_REGION'),
+    'SQS_ENDPOINT_URL': os.getenv('SQS_ENDPOINT_URL')
 }
\ No newline at end of file
@@ -13,13 +13,28 @@ $ for line in "$(aws-vault exec support-soak ./sqs.py)"; do echo "$line" | jq -r
 to see the output.
 """
 
-from typing import Any, Dict, Optional, Union, Set
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union, Set
 
 import boto3
+import functools
 import json
-import uuid
-
+import queue
+import re
+import sys
+import threading
+import warnings
+
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime as dt
+from settings import env
+from types import MappingProxyType
+
+try:
+    # C-implemented and handles the datetimes boto3 returns.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 QUEUE_NAME = 'example_queue'
@@ -27,49 +42,174 @@ QUEUE_NAME_FIFO = 'example_fifo_queue.fifo'
 QUEUE_NAME_DEAD = 'example_dead_queue'
 QUEUE_MAIN = 'main_queue'
 
-
-def sqs_client() -> Any:
+# SendMessageBatch limits.
+# https://docs.aws.amazon.com/AWSSimpleQueueService/latest/APIReference/API_SendMessageBatch.html
+BATCH_MAX_ENTRIES = 10
+BATCH_MAX_BYTES = 256 * 1024
+
+# Attribute templates merged by sqs_create_queue. Read-only, since every call shares them.
+_FIFO_ATTRIBUTES = MappingProxyType({
+    'FifoQueue': 'true'
+})
+_DEAD_DEPENDENCY_ATTRIBUTES = MappingProxyType({
+    'DelaySeconds': '0',
+    'MaximumMessageSize': '262144',
+    'VisibilityTimeout': '30',
+    'MessageRetentionPeriod': '345680'
+})
+_REDRIVE_POLICY_TEMPLATE = '{"deadLetterTargetArn": "%s", "maxReceiveCount": 3}'
+_QUEUE_ARN = re.compile(r'arn:aws[a-z-]*:sqs:[a-z0-9-]+:\d{12}:[\w.-]+')
+
+# (region, endpoint, queue name) => ARN, filled in by get_queue_arn.
+_ARN_CACHE: Dict[Tuple[str, str, str], str] = dict()
+
+# Example message used by the script below. The date is computed once, at import. The attributes are read-only, all
+# the way down, since every entry built from them shares them. (This relies on parameter_validation=False in CONFIG
+# below; botocore's validator only accepts plain dicts.)
+EXAMPLE_MESSAGE_BODY = 'This is my first SQS message!!! :D :D'
+EXAMPLE_MESSAGE_ATTRIBUTES = MappingProxyType({
+    'Title': MappingProxyType({
+        'DataType': 'String',
+        'StringValue': 'My example message'
+    }),
+    'Author': MappingProxyType({
+        'DataType': 'String',
+        'StringValue': 'Example Author'
+    }),
+    'Date': MappingProxyType({
+        'DataType': 'String',
+        'StringValue': dt.now().isoformat()
+    })
+})
+
+# One session shared by the client and resource below, rather than the implicit default session per call.
+_SESSION = boto3.session.Session()
+CONFIG = Config(
+    region_name=env['AWS_REGION'],
+    signature_version='v4',
+    # Leave room in the connection pool for concurrent calls (e.g. deleting many queues at once).
+    max_pool_connections=100,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=3,
+    # Long polls wait up to 20 seconds before SQS responds.
+    read_timeout=25,
+    # Skip botocore's client-side parameter validation on every request (e.g. each poll in process_queue); SQS
+    # still rejects bad parameters.
+    parameter_validation=False
+)
+
+
+@functools.lru_cache(maxsize=None)
+def sqs_client(endpoint_url: Optional[str] =env['SQS_ENDPOINT_URL']) -> Any:
     """
-    Get an SQS client object.
+    Get an SQS client object. The client is built once per endpoint and shared on subsequent calls.
+
+    Args:
+        endpoint_url: optionally send requests to another endpoint, e.g. a VPC interface endpoint for SQS. Defaults
+            to $SQS_ENDPOINT_URL, or the public regional endpoint if that isn't set.
 
     Returns:
         The client object we can make API calls with.
     """
-    client = boto3.client('sqs')
+    client = _SESSION.client('sqs', endpoint_url=endpoint_url, config=CONFIG)
     return client
 
 
-def sqs_resource() -> Any:
+@functools.lru_cache(maxsize=None)
+def sqs_resource(endpoint_url: Optional[str] =env['SQS_ENDPOINT_URL']) -> Any:
     """
-    Get an SQS resource object.
+    Get an SQS resource object. The resource is built once per endpoint and shared on subsequent calls.
+
+    Args:
+        endpoint_url: optionally send requests to another endpoint, e.g. a VPC interface endpoint for SQS. Defaults
+            to $SQS_ENDPOINT_URL, or the public regional endpoint if that isn't set.
 
     Returns:
         The resource object.
     """
-    resource = boto3.resource('sqs')
+    resource = _SESSION.resource('sqs', endpoint_url=endpoint_url, config=CONFIG)
     return resource
 
 
-def sqs_create_queue(client: Any, name: Optional[str] =None) -> Dict:
+def sqs_create_queue(client: Any, name: Optional[str] =None, *, fifo: bool =False, dlq_arn: Optional[str] =None,
+                     long_poll: int =20) -> Dict:
     """
     Create an SQS queue.
 
     Args:
         client: client object we can make API calls with.
         name: optionally set the name of the queue to something other than the default.
+        fifo: create a FIFO queue. The name must end in '.fifo'.
+        dlq_arn: optionally set a redrive policy pointed at this (dead letter) queue's ARN.
+        long_poll: how long receives on the queue wait for messages by default, clamped to [0, 20]. 0 is short polling.
 
     Returns:
         The new SQS queue description / dict.
+
+    Raises:
+        A ValueError when dlq_arn is not an SQS queue ARN.
     """
+    if name is None:
+        name = QUEUE_NAME_FIFO if fifo else QUEUE_MAIN if dlq_arn is not None else QUEUE_NAME
+
+    attributes = {'ReceiveMessageWaitTimeSeconds': str(max(0, min(20, long_poll)))}
+    if fifo:
+        attributes.update(_FIFO_ATTRIBUTES)
+    if dlq_arn is not None:
+        if not _QUEUE_ARN.fullmatch(dlq_arn):
+            raise ValueError(f'Expected an SQS queue ARN, got {dlq_arn!r}.')
+        attributes.update(_DEAD_DEPENDENCY_ATTRIBUTES)
+        # Set my redrive policy. The ARN is validated above, so it needs no JSON escaping.
+        # https://docs.aws.amazon.com/AWSSimpleQueueService/latest/SQSDeveloperGuide/sqs-dead-letter-queues.html
+        attributes['RedrivePolicy'] = _REDRIVE_POLICY_TEMPLATE % dlq_arn
+
     queue_desc = client.create_queue(
-        QueueName=QUEUE_NAME if name is None else name
+        QueueName=name,
+        Attributes=attributes
     )
     return queue_desc
 
 
+def sqs_delete_queue_one(client: Any, url: str) -> Dict:
+    """
+    Delete an SQS queue.
+
+    Args:
+        client: client object we can make API calls with.
+        url: URL of the queue.
+
+    Returns:
+        The response object.
+    """
+    return client.delete_queue(QueueUrl=url)
+
+
+def sqs_delete_queue_many(client: Any, urls: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Delete SQS queues concurrently. The client is thread-safe, so the calls are fanned out over a thread pool.
+
+    Args:
+        client: client object we can make API calls with.
+        urls: URLs of the queues.
+
+    Returns:
+        A dict of URL => response object.
+    """
+    urls = set(urls)
+    response = dict()
+    if not urls:
+        return response
+    with ThreadPoolExecutor(max_workers=min(32, len(urls))) as executor:
+        futures = {executor.submit(client.delete_queue, QueueUrl=_url): _url for _url in urls}
+        for future in as_completed(futures):
+            response.update({futures[future]: future.result()})
+    return response
+
+
 def sqs_delete_queue(client: Any, url: Union[str, Set[str]]) -> Optional[dict]:
     """
-    Delete SQS queues.
+    Delete SQS queues. Prefer sqs_delete_queue_one or sqs_delete_queue_many when you know which you have.
 
     Args:
         client: client object we can make API calls with.
@@ -80,20 +220,17 @@ def sqs_delete_queue(client: Any, url: Union[str, Set[str]]) -> Optional[dict]:
     """
     if isinstance(url, str):
         # Get a 'ResponseMetadata' dict back.
-        return client.delete_queue(QueueUrl=url)
+        return sqs_delete_queue_one(client, url)
     elif isinstance(url, set):
         # Get a dict of URL => 'ResponseMetadata' back.
-        response = dict()
-        for _url in url:
-            response.update({_url: client.delete_queue(QueueUrl=_url)})
-        return response
+        return sqs_delete_queue_many(client, url)
     else:
         raise TypeError('Must submit either a name as a string or a set object of names.')
 
 
 def sqs_create_fifo_queue(client: Any, name: Optional[str] =None) -> Dict:
     """
-    Create a FIFO queue.
+    Create a FIFO queue. Deprecated; use sqs_create_queue(client, name, fifo=True).
 
     Args:
         client: client object we can make API calls with.
@@ -102,18 +239,15 @@ def sqs_create_fifo_queue(client: Any, name: Optional[str] =None) -> Dict:
     Returns:
         The new FIFO SQS queue description / dict.
     """
-    queue_desc = client.create_queue(
-        QueueName=QUEUE_NAME_FIFO if name is None else name,
-        Attributes={
-            'FifoQueue': 'true'
-        }
-    )
-    return queue_desc
+    warnings.warn('sqs_create_fifo_queue is deprecated; use sqs_create_queue(..., fifo=True).', DeprecationWarning,
+                  stacklevel=2)
+    return sqs_create_queue(client, QUEUE_NAME_FIFO if name is None else name, fifo=True)
 
 
 def sqs_create_queue_dead_dependency(client: Any, dep_arn: str, name: Optional[str] =None) -> Dict:
     """
-    Create a queue with a redrive policy pointed at another queue's ARN.
+    Create a queue with a redrive policy pointed at another queue's ARN. Deprecated; use
+    sqs_create_queue(client, name, dlq_arn=dep_arn).
 
     Args:
         client: client object we can make API calls with.
@@ -122,30 +256,19 @@ def sqs_create_queue_dead_dependency(client: Any, dep_arn: str, name: Optional[s
 
     Returns:
         The new dead/dep SQS queue description / dict.
+
+    Raises:
+        A ValueError when dep_arn is not an SQS queue ARN.
     """
-    policy = json.dumps({
-        'deadLetterTargetArn': dep_arn,
-        'maxReceiveCount': 3
-    })
-    sqs = client.create_queue(
-        QueueName=QUEUE_MAIN if name is None else name,
-        Attributes={
-            'DelaySeconds': '0',
-            'MaximumMessageSize': '262144',
-            'VisibilityTimeout': '30',
-            'MessageRetentionPeriod': '345680',
-            'ReceiveMessageWaitTimeSeconds': '0',
-            # Set my redrive policy.
-            # https://docs.aws.amazon.com/AWSSimpleQueueService/latest/SQSDeveloperGuide/sqs-dead-letter-queues.html
-            'RedrivePolicy': policy
-        }
-    )
-    return sqs
+    warnings.warn('sqs_create_queue_dead_dependency is deprecated; use sqs_create_queue(..., dlq_arn=...).',
+                  DeprecationWarning, stacklevel=2)
+    return sqs_create_queue(client, QUEUE_MAIN if name is None else name, dlq_arn=dep_arn)
 
 
 def get_queue_arn(resource: Any, name: str) -> str:
     """
-    Get a queue's ARN by name.
+    Get a queue's ARN by name. ARNs don't change for the life of a queue, so results are cached by the
+    resource's region and endpoint, and the name.
 
     Args:
         resource: resource object we can make API calls with.
@@ -155,8 +278,15 @@ def get_queue_arn(resource: Any, name: str) -> str:
         The queue's ARN.
     """
     # TODO: make this safe in the event the queue does not exist.
-    arn = resource.get_queue_by_name(QueueName=name).attributes['QueueArn']
-    return arn
+    client = resource.meta.client
+    key = (client.meta.region_name, client.meta.endpoint_url, name)
+    if key not in _ARN_CACHE:
+        url = client.get_queue_url(QueueName=name)['QueueUrl']
+        _ARN_CACHE[key] = client.get_queue_attributes(
+            QueueUrl=url,
+            AttributeNames=['QueueArn']
+        )['Attributes']['QueueArn']
+    return _ARN_CACHE[key]
 
 
 def send_message_to_queue(client: Any, url: str, msg: dict) -> Dict:
@@ -178,9 +308,55 @@ def send_message_to_queue(client: Any, url: str, msg: dict) -> Dict:
     return response
 
 
+def _message_size(msg: Mapping) -> int:
+    """
+    Size of a message as SQS counts it against the payload limit: the body, plus each attribute's name, data type
+    and value.
+
+    Args:
+        msg: a message / batch entry.
+
+    Returns:
+        The size, in bytes.
+    """
+    def _len(value: Union[str, bytes]) -> int:
+        return len(value.encode('utf-8') if isinstance(value, str) else value)
+
+    size = _len(msg.get('MessageBody', ''))
+    for name, attribute in msg.get('MessageAttributes', {}).items():
+        size += _len(name) + _len(attribute.get('DataType', ''))
+        size += _len(attribute.get('StringValue', attribute.get('BinaryValue', b'')))
+    return size
+
+
+def split_batches(msgs: list) -> List[list]:
+    """
+    Split messages into sub-batches that respect the SendMessageBatch entry count and payload size limits.
+
+    Args:
+        msgs: messages to send to a queue.
+
+    Returns:
+        A list of sub-batches, in order.
+    """
+    batches = []
+    batch, batch_size = [], 0
+    for msg in msgs:
+        msg_size = _message_size(msg)
+        if batch and (len(batch) == BATCH_MAX_ENTRIES or batch_size + msg_size > BATCH_MAX_BYTES):
+            batches.append(batch)
+            batch, batch_size = [], 0
+        batch.append(msg)
+        batch_size += msg_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 def send_batch_messages(client: Any, url: str, msgs: list) -> Dict:
     """
-    Send batched messages to a queue.
+    Send batched messages to a queue. Messages are split into sub-batches that respect the SendMessageBatch entry
+    count and payload size limits, and the sub-batches are sent concurrently.
 
     Args:
         client: client object we can make API calls with.
@@ -188,67 +364,183 @@ def send_batch_messages(client: Any, url: str, msgs: list) -> Dict:
         msgs: messages to send to the queue.
 
     Returns:
-        The response object.
+        The response object, with 'Successful' and 'Failed' entries merged across all sub-batches.
+    """
+    batches = split_batches(msgs)
+    response = {'Successful': [], 'Failed': []}
+    if not batches:
+        return response
+    with ThreadPoolExecutor(max_workers=min(32, len(batches))) as executor:
+        futures = [executor.submit(client.send_message_batch, QueueUrl=url, Entries=_batch) for _batch in batches]
+        for future in as_completed(futures):
+            result = future.result()
+            response['Successful'].extend(result.get('Successful', []))
+            response['Failed'].extend(result.get('Failed', []))
+    return response
+
+
+def delete_batch_messages(client: Any, url: str, receipts: list) -> Dict:
+    """
+    Delete a batch of (up to 10) messages from a queue. Only time this should be called is when we've processed them.
+
+    Args:
+        client: client object we can make API calls with.
+        url: URL of the queue.
+        receipts: handles returned when polling messages on a queue.
+
+    Returns:
+        The response object, with any entries that could not be deleted under 'Failed'.
     """
-    response = client.send_message_batch(
+    response = client.delete_message_batch(
         QueueUrl=url,
-        Entries=msgs
+        Entries=[{'Id': str(i), 'ReceiptHandle': receipt} for i, receipt in enumerate(receipts)]
     )
     return response
 
 
-def poll_queue(client: Any, url: str, max_messages: int =10) -> Dict:
+def poll_queue(client: Any, url: str, max_messages: int =10, wait_time_seconds: int =20) -> Dict:
     """
     Poll queue for messages. NOTE: this is not guaranteed to get me all of the messages ready to be processed on my queue.
 
+    https://docs.aws.amazon.com/AWSSimpleQueueService/latest/SQSDeveloperGuide/sqs-short-and-long-polling.html
+
     Args:
         client: client object we can make API calls with.
         url: queue to send the message to.
+        max_messages: maximum number of messages to receive (1-10).
+        wait_time_seconds: how long to long poll for messages, clamped to [0, 20]. 0 is short polling.
 
     Returns:
         The response object.
     """
     response = client.receive_message(
         QueueUrl=url,
-        MaxNumberOfMessages=max_messages
+        MaxNumberOfMessages=max_messages,
+        WaitTimeSeconds=max(0, min(20, wait_time_seconds))
     )
     return response
 
 
-def process_queue(client: Any, url: str) -> None:
+def _put_batch(batches: queue.Queue, item: Optional[list], abort: threading.Event) -> None:
+    """
+    Put an item on the pipeline's queue, giving up if the pipeline has been aborted.
+
+    Args:
+        batches: queue shared by the receiver and the handlers.
+        item: list of messages, or None to tell a handler there's nothing more to come.
+        abort: set when a handler or the caller has failed.
     """
-    Process messages from a queue.
+    while not abort.is_set():
+        try:
+            batches.put(item, timeout=1)
+            return
+        except queue.Full:
+            continue
+
+
+def _receive_batches(client: Any, url: str, batches: queue.Queue, abort: threading.Event, workers: int,
+                     wait_time_seconds: int, max_iterations: Optional[int], stop_event: Optional[threading.Event]) -> None:
+    """
+    Poll a queue until it comes back empty, handing each list of messages to the handlers.
 
     Args:
         client: client object we can make API calls with.
-        url: queue to send the message to.
+        url: URL of the queue.
+        batches: queue shared by the receiver and the handlers.
+        abort: set when a handler or the caller has failed.
+        workers: number of handlers to send a sentinel to once we're done.
+        wait_time_seconds: how long each poll waits for messages before we consider the queue drained.
+        max_iterations: optionally bound the number of polls.
+        stop_event: optionally stop polling once this event is set.
+    """
+    try:
+        iterations = 0
+        while max_iterations is None or iterations < max_iterations:
+            if abort.is_set() or (stop_event is not None and stop_event.is_set()):
+                break
+            iterations += 1
+
+            objects = poll_queue(client, url, max_messages=10, wait_time_seconds=wait_time_seconds)
+            if 'Messages' not in objects or len(objects['Messages']) == 0:
+                break
+            _put_batch(batches, objects['Messages'], abort)
+    finally:
+        for _ in range(workers):
+            _put_batch(batches, None, abort)
+
+
+def _handle_batches(client: Any, url: str, batches: queue.Queue, abort: threading.Event) -> None:
+    """
+    Process and delete lists of messages from the pipeline's queue until told to stop.
 
-    Returns:
-        The response object from processing items on the SQS.
+    Args:
+        client: client object we can make API calls with.
+        url: URL of the queue.
+        batches: queue shared by the receiver and the handlers.
+        abort: set when a handler or the caller has failed.
     """
+    try:
+        while not abort.is_set():
+            try:
+                messages = batches.get(timeout=1)
+            except queue.Empty:
+                continue
+            if messages is None:
+                return
+
+            for message in messages:
+                print(f"Processing message: {message['MessageId']}; body: {message['Body']}")
+
+            # One round trip to delete the whole batch, rather than one per message.
+            response = delete_batch_messages(client, url, [message['ReceiptHandle'] for message in messages])
+            for failure in response.get('Failed', []):
+                print(f"Failed to delete message: {failure['Id']}; code: {failure['Code']}; reason: {failure.get('Message')}")
+    except BaseException:
+        abort.set()
+        raise
+
+
+def process_queue(client: Any, url: str, wait_time_seconds: int =1, max_iterations: Optional[int] =None,
+                  stop_event: Optional[threading.Event] =None, workers: int =1) -> None:
+    """
+    Process messages from a queue, polling until the queue comes back empty. Receiving runs on its own thread and
+    hands lists of messages to the handlers through a bounded queue, so the next poll is in flight while the
+    previous batch is processed and deleted.
 
-    def delete_message_from_queue(receipt: str) -> Dict:
-        """
-        Delete a message from a queue. Only time this should be called is when we've processed it (for this script).
+    Args:
+        client: client object we can make API calls with.
+        url: queue to send the message to.
+        wait_time_seconds: how long each poll waits for messages before we consider the queue drained.
+        max_iterations: optionally bound the number of polls.
+        stop_event: optionally stop polling once this event is set.
+        workers: number of threads processing and deleting messages.
 
-        Args:
-            receipt: handle returned when polling messages on a queue.
+    NOTE: up to 4 received batches can wait on the queue on top of the ones being handled. If processing is slow,
+    those can sit past the queue's VisibilityTimeout (30 seconds for queues made here) and SQS will redeliver them.
 
-        Returns:
-            The response object.
-        """
-        nonlocal client, url
-        response = client.delete_message(
-            QueueUrl=url,
-            ReceiptHandle=receipt
-        )
-        return response
+    Returns:
+        The response object from processing items on the SQS.
 
-    objects = poll_queue(client, url)
-    if 'Messages' in objects and len(objects['Messages']) != 0:
-        for message in objects['Messages']:
-            print(f"Processing message: {message['MessageId']}; body: {message['Body']}")
-            delete_message_from_queue(message['ReceiptHandle'])
+    Raises:
+        A ValueError when workers is less than 1.
+    """
+    if workers < 1:
+        raise ValueError(f'Must have at least one worker, got {workers}.')
+    batches = queue.Queue(maxsize=4)
+    abort = threading.Event()
+    with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+        try:
+            receiver = executor.submit(
+                _receive_batches, client, url, batches, abort, workers, wait_time_seconds, max_iterations, stop_event
+            )
+            handlers = [executor.submit(_handle_batches, client, url, batches, abort) for _ in range(workers)]
+            for handler in handlers:
+                handler.result()
+            receiver.result()
+        except BaseException:
+            # Stop the receiver and handlers too (e.g. on Ctrl-C), otherwise leaving the executor waits on them.
+            abort.set()
+            raise
 
     return None
 
@@ -291,6 +583,22 @@ def purge_queue(client: Any, url: str) -> Dict:
     return response
 
 
+def print_response(response: Dict) -> None:
+    """
+    Write a response object to stdout as a single line of JSON, without the (large, uninteresting) 'ResponseMetadata'.
+
+    Args:
+        response: the response object returned by an API call.
+    """
+    response = {k: v for k, v in response.items() if k != 'ResponseMetadata'}
+    if orjson is not None:
+        # Flush any pending text output so lines stay in order when writing bytes straight to the buffer.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(response, default=str, option=orjson.OPT_NAIVE_UTC) + b'\n')
+    else:
+        sys.stdout.write(json.dumps(response, default=str) + '\n')
+
+
 if __name__ == '__main__':
     client = sqs_client()
     resource = sqs_resource()
@@ -298,73 +606,66 @@ if __name__ == '__main__':
 
     ## Queue creation
 
-    # Regular example queue (can be lossy?)
-    reg_response = sqs_create_queue(client)
-    QUEUE_URL_REG = reg_response['QueueUrl']
-    queue_urls.add(QUEUE_URL_REG)
-    print(json.dumps(reg_response))
+    # Regular example queue (can be lossy?), FIFO queue (not lossy) and the dead letter queue. These don't depend on
+    # each other, so create them concurrently.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'reg': executor.submit(sqs_create_queue, client),
+            'fifo': executor.submit(sqs_create_queue, client, QUEUE_NAME_FIFO, fifo=True),
+            'dead': executor.submit(sqs_create_queue, client, name=QUEUE_NAME_DEAD)
+        }
+    responses = {key: future.result() for key, future in futures.items()}
 
-    # FIFO queue (not lossy)
-    fifo_response = sqs_create_fifo_queue(client)
-    QUEUE_URL_FIFO = fifo_response['QueueUrl']
-    queue_urls.add(QUEUE_URL_FIFO)
-    print(json.dumps(fifo_response))
+    # Print in a fixed order, regardless of which finished first.
+    for key in ('reg', 'fifo', 'dead'):
+        print_response(responses[key])
 
-    ## Dead Letter
+    QUEUE_URL_REG = responses['reg']['QueueUrl']
+    QUEUE_URL_FIFO = responses['fifo']['QueueUrl']
+    QUEUE_URL_DEAD = responses['dead']['QueueUrl']
+    queue_urls.update({QUEUE_URL_REG, QUEUE_URL_FIFO, QUEUE_URL_DEAD})
 
-    # Dead letter queue
-    dead_response = sqs_create_queue(client, name=QUEUE_NAME_DEAD)
-    QUEUE_URL_DEAD = dead_response['QueueUrl']
-    queue_urls.add(QUEUE_URL_DEAD)
-    print(json.dumps(dead_response))
+    ## Dead Letter
 
-    # Main queue
-    main_response = sqs_create_queue_dead_dependency(client, dep_arn=get_queue_arn(resource, name=QUEUE_NAME_DEAD), name=QUEUE_MAIN)
+    # Main queue (needs the dead letter queue's ARN, so it has to wait for the above)
+    main_response = sqs_create_queue(client, name=QUEUE_MAIN, dlq_arn=get_queue_arn(resource, name=QUEUE_NAME_DEAD))
     QUEUE_URL_MAIN = main_response['QueueUrl']
     queue_urls.add(QUEUE_URL_MAIN)
-    print(json.dumps(main_response))
+    print_response(main_response)
 
     ## Send a Message
 
     # Send a single message.
 
     example_message = {
-        'MessageAttributes': {
-            'Title': {
-                'DataType': 'String',
-                'StringValue': 'My example message'
-            },
-            'Author': {
-                'DataType': 'String',
-                'StringValue': 'Example Author'
-            },
-            'Date': {
-                'DataType': 'String',
-                'StringValue': str(dt.now())
-            }
-        },
-        'MessageBody': 'This is my first SQS message!!! :D :D'
+        'MessageAttributes': EXAMPLE_MESSAGE_ATTRIBUTES,
+        'MessageBody': EXAMPLE_MESSAGE_BODY
     }
     send_message_response = send_message_to_queue(client, QUEUE_URL_REG, example_message)
-    print(json.dumps(send_message_response))
+    print_response(send_message_response)
 
     # Send a batch of messages.
     
-    # The dict.update method here was awful. Probably some mutability issue I'm now aware of? 
-    entries = [{'Id': str(uuid.uuid1()), **example_message} for _ in range(4)]
-    print(json.dumps(send_batch_messages(client, QUEUE_URL_REG, entries)))
+    # Ids only need to be unique within a single batch, so the index will do. Every entry shares the read-only
+    # attributes rather than copying them; build a new dict if an entry needs its own attributes.
+    entries = [
+        {'Id': str(i), 'MessageBody': EXAMPLE_MESSAGE_BODY, 'MessageAttributes': EXAMPLE_MESSAGE_ATTRIBUTES}
+        for i in range(4)
+    ]
+    print_response(send_batch_messages(client, QUEUE_URL_REG, entries))
 
     # Poll queue
-    #print(json.dumps(poll_queue(client, QUEUE_URL_REG)))
+    #print_response(poll_queue(client, QUEUE_URL_REG))
 
     # Process queue
     process_queue(client, QUEUE_URL_REG)
 
     # Purge a queue (only allowed every 60 seconds)
-    #print(json.dumps(purge_queue(client, QUEUE_URL_REG)))
+    #print_response(purge_queue(client, QUEUE_URL_REG))
 
     ## Deletion
 
     # Delete all queues. Be weary of an error message like the following from a timeout.
     # botocore.errorfactory.QueueDeletedRecently: An error occurred (AWS.SimpleQueueService.QueueDeletedRecently) when calling the CreateQueue operation: You must wait 60 seconds after deleting a queue before you can create another with the same name.
-    #print(json.dumps(sqs_delete_queue(client, QUEUE_URL_REG)))
\ No newline at end of file
+    #print_response(sqs_delete_queue_one(client, QUEUE_URL_REG))
+    #print_response(sqs_delete_queue_many(client, queue_urls))
\ No newline at end of file
@@ -0,0 +1,169 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Async variants of the SQS helpers in sqs.py, built on aioboto3, so that many in-flight requests can share one event
+loop instead of one thread each.
+
+Run this script as
+
+$ aws-vault exec support-soak ./sqs_async.py
+
+against a queue created by sqs.py.
+"""
+
+from typing import Any, Dict, Optional
+
+import aioboto3
+import asyncio
+
+from settings import env
+
+from sqs import QUEUE_NAME, EXAMPLE_MESSAGE_BODY, EXAMPLE_MESSAGE_ATTRIBUTES, CONFIG, split_batches, print_response
+
+
+def sqs_client(session: Optional[aioboto3.Session] =None, endpoint_url: Optional[str] =env['SQS_ENDPOINT_URL']) -> Any:
+    """
+    Get an async SQS client. Use it as an async context manager.
+
+    Args:
+        session: optionally reuse an existing aioboto3 session.
+        endpoint_url: optionally send requests to another endpoint, e.g. a VPC interface endpoint for SQS.
+
+    Returns:
+        The client context manager.
+    """
+    session = aioboto3.Session() if session is None else session
+    return session.client('sqs', endpoint_url=endpoint_url, config=CONFIG)
+
+
+async def send_message_to_queue(client: Any, url: str, msg: dict) -> Dict:
+    """
+    Send a message to a queue.
+
+    Args:
+        client: async client object we can make API calls with.
+        url: queue to send the message to.
+        msg: message to send to the queue.
+
+    Returns:
+        The response object.
+    """
+    response = await client.send_message(
+        QueueUrl=url,
+        **msg
+    )
+    return response
+
+
+async def send_batch_messages(client: Any, url: str, msgs: list) -> Dict:
+    """
+    Send batched messages to a queue. Messages are split into sub-batches that respect the SendMessageBatch entry
+    count and payload size limits, and the sub-batches are sent concurrently.
+
+    Args:
+        client: async client object we can make API calls with.
+        url: queue to send the message to.
+        msgs: messages to send to the queue.
+
+    Returns:
+        The response object, with 'Successful' and 'Failed' entries merged across all sub-batches.
+    """
+    batches = split_batches(msgs)
+    response = {'Successful': [], 'Failed': []}
+    results = await asyncio.gather(*[client.send_message_batch(QueueUrl=url, Entries=_batch) for _batch in batches])
+    for result in results:
+        response['Successful'].extend(result.get('Successful', []))
+        response['Failed'].extend(result.get('Failed', []))
+    return response
+
+
+async def delete_batch_messages(client: Any, url: str, receipts: list) -> Dict:
+    """
+    Delete a batch of (up to 10) messages from a queue. Only time this should be called is when we've processed them.
+
+    Args:
+        client: async client object we can make API calls with.
+        url: URL of the queue.
+        receipts: handles returned when polling messages on a queue.
+
+    Returns:
+        The response object, with any entries that could not be deleted under 'Failed'.
+    """
+    response = await client.delete_message_batch(
+        QueueUrl=url,
+        Entries=[{'Id': str(i), 'ReceiptHandle': receipt} for i, receipt in enumerate(receipts)]
+    )
+    return response
+
+
+async def poll_queue(client: Any, url: str, max_messages: int =10, wait_time_seconds: int =20) -> Dict:
+    """
+    Poll queue for messages.
+
+    Args:
+        client: async client object we can make API calls with.
+        url: queue to send the message to.
+        max_messages: maximum number of messages to receive (1-10).
+        wait_time_seconds: how long to long poll for messages, clamped to [0, 20]. 0 is short polling.
+
+    Returns:
+        The response object.
+    """
+    response = await client.receive_message(
+        QueueUrl=url,
+        MaxNumberOfMessages=max_messages,
+        WaitTimeSeconds=max(0, min(20, wait_time_seconds))
+    )
+    return response
+
+
+async def process_queue(client: Any, url: str, wait_time_seconds: int =1, max_iterations: Optional[int] =None,
+                        stop_event: Optional[asyncio.Event] =None) -> None:
+    """
+    Process messages from a queue, polling until the queue comes back empty.
+
+    Args:
+        client: async client object we can make API calls with.
+        url: queue to send the message to.
+        wait_time_seconds: how long each poll waits for messages before we consider the queue drained.
+        max_iterations: optionally bound the number of polls.
+        stop_event: optionally stop polling once this event is set.
+    """
+    iterations = 0
+    while max_iterations is None or iterations < max_iterations:
+        if stop_event is not None and stop_event.is_set():
+            break
+        iterations += 1
+
+        objects = await poll_queue(client, url, max_messages=10, wait_time_seconds=wait_time_seconds)
+        if 'Messages' not in objects or len(objects['Messages']) == 0:
+            break
+
+        for message in objects['Messages']:
+            print(f"Processing message: {message['MessageId']}; body: {message['Body']}")
+
+        response = await delete_batch_messages(client, url, [message['ReceiptHandle'] for message in objects['Messages']])
+        for failure in response.get('Failed', []):
+            print(f"Failed to delete message: {failure['Id']}; code: {failure['Code']}; reason: {failure.get('Message')}")
+
+    return None
+
+
+async def main() -> None:
+    async with sqs_client() as client:
+        url = (await client.get_queue_url(QueueName=QUEUE_NAME))['QueueUrl']
+
+        # Send a batch of messages; sub-batches go out concurrently on the one event loop.
+        entries = [
+            {'Id': str(i), 'MessageBody': EXAMPLE_MESSAGE_BODY, 'MessageAttributes': EXAMPLE_MESSAGE_ATTRIBUTES}
+            for i in range(40)
+        ]
+        print_response(await send_batch_messages(client, url, entries))
+
+        # Process queue
+        await process_queue(client, url)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())